@@ -3,12 +3,325 @@ Final step: Create a four-panel statistics meme demonstrating selection bias.
 Assembles original image, stippled image, block letter, and masked image.
 """
 
+import atexit
+from concurrent.futures import Future, ProcessPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib import gridspec
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+from matplotlib.transforms import IdentityTransform
+from PIL import Image
 import os
 
 
+# Reused across calls so repeated memes don't rebuild the figure and axes
+_fig = None
+_ax = None
+_titles: list[Text] = []
+
+# Single worker process that encodes and writes PNGs off the main thread
+_executor = None
+_pending_writes: list[Future] = []
+
+# Titles for each panel
+_PANEL_TITLES = ["Reality", "Your Model", "Selection Bias", "Estimate"]
+
+# Agg cannot draw figures of 2**16 pixels or more in either dimension;
+# batched figures are kept well under it
+_AGG_MAX_PIXELS = 1 << 16
+_MAX_BATCH_HEIGHT = 32768
+
+# Meme figure width in inches
+_MEME_WIDTH = 16
+
+
+def _get_meme_figure() -> tuple[Figure, Axes]:
+    """
+    Lazily build the meme figure (one axes for all panels) on a
+    non-interactive Agg canvas.
+    """
+    global _fig, _ax
+    if _fig is None:
+        # Render straight to an Agg canvas, independent of the pyplot backend
+        _fig = Figure(figsize=(16, 4))
+        FigureCanvasAgg(_fig)
+        _ax = _fig.subplots()
+    return _fig, _ax
+
+
+def _get_meme_titles(fig: Figure, n_rows: int) -> list[Text]:
+    """
+    Return one overall-title text per meme row, reusing the figure texts
+    from earlier calls and hiding any that are not needed.
+    
+    Plain figure texts avoid suptitle's extra layout bookkeeping. They are
+    positioned in display pixels by the caller.
+    """
+    while len(_titles) < n_rows:
+        _titles.append(fig.text(0, 0, "Selection Bias & Missing Data",
+                                transform=IdentityTransform(),
+                                ha='center', va='center', fontsize=20, fontweight='bold'))
+    for i, title in enumerate(_titles):
+        title.set_visible(i < n_rows)
+    return _titles[:n_rows]
+
+
+def _meme_layout(height: int, width: int, dpi: int) -> tuple[int, int, int, int, int, int, int]:
+    """
+    Pixel layout of one 16-inch-wide meme row around a (height, width) image.
+    
+    Images narrower than the figure are drawn at the largest integer scale
+    that fits, so nothing is resampled. Wider images are decimated by an
+    integer step until they fit.
+    
+    Returns
+    -------
+    step, scale : int
+        Decimation step and upscale factor applied to the image
+    fig_width, row_height : int
+        Figure width and height of one row (title band + image + margin) in pixels
+    left, top, bottom : int
+        Left, title band and bottom margins in pixels
+    """
+    fig_width = round(_MEME_WIDTH * dpi)
+    if fig_width >= _AGG_MAX_PIXELS:
+        raise ValueError(f"dpi={dpi} gives a {fig_width} px wide meme, "
+                         f"over Agg's limit of {_AGG_MAX_PIXELS} px")
+    
+    side, top, bottom = int(0.2 * dpi), int(0.9 * dpi), int(0.1 * dpi)
+    available = fig_width - 2 * side
+    if width <= available:
+        step, scale = 1, available // width
+    else:
+        step, scale = -(-width // available), 1
+    image_width = scale * -(-width // step)
+    image_height = scale * -(-height // step)
+    left = (fig_width - image_width) // 2
+    
+    # Round the title band up so the band between stacked rows is a whole
+    # number of image rows at this scale
+    top += -(top + bottom) % scale
+    row_height = image_height + top + bottom
+    if row_height >= _AGG_MAX_PIXELS:
+        raise ValueError(f"A {height}x{width} meme at dpi={dpi} is {row_height} px tall, "
+                         f"over Agg's limit of {_AGG_MAX_PIXELS} px")
+    return step, scale, fig_width, row_height, left, top, bottom
+
+
+def _size_meme_figure(
+    fig: Figure, n_rows: int, height: int, width: int, dpi: int
+) -> tuple[int, int, int, int, int, int, int]:
+    """
+    Size the figure in whole pixels around n_rows stacked (height, width)
+    meme images and return the row layout (see _meme_layout).
+    """
+    layout = _meme_layout(height, width, dpi)
+    step, scale, fig_w, row_height, left, top, bottom = layout
+    image_width = scale * -(-width // step)
+    fig_h = n_rows * row_height
+    
+    fig.set_dpi(dpi)
+    fig.set_size_inches(fig_w / dpi, fig_h / dpi)
+    fig.subplots_adjust(left=left / fig_w, right=(left + image_width) / fig_w,
+                        top=1 - top / fig_h, bottom=bottom / fig_h)
+    return layout
+
+
+def _to_uint8(img: np.ndarray) -> np.ndarray:
+    """
+    Convert a panel to uint8 in [0, 255] (float panels are assumed in [0, 1]).
+    """
+    if img.dtype == np.uint8:
+        return img
+    return (np.clip(img, 0.0, 1.0) * 255 + 0.5).astype(np.uint8)
+
+
+def _gap_width(panel_width: int) -> int:
+    """
+    Width in pixels of the gap between panels.
+    """
+    return max(1, int(0.05 * panel_width))
+
+
+def _combine_panels(images: list[np.ndarray]) -> tuple[np.ndarray, list[float], list[tuple[int, int]]]:
+    """
+    Concatenate same-height 2-D panels side by side into one uint8 image.
+    
+    Returns
+    -------
+    combined : np.ndarray
+        Combined (height, total_width) image
+    centers : list[float]
+        x coordinate (in image pixels) of the center of each panel
+    gaps : list[tuple[int, int]]
+        (start, stop) columns of the gaps between panels, which the caller
+        masks so the figure background shows through
+    """
+    for img in images:
+        if img.ndim != 2:
+            raise ValueError(f"Meme panels must be 2-D grayscale images, got shapes {[img.shape for img in images]}")
+    height = images[0].shape[0]
+    for img in images:
+        if img.shape[0] != height:
+            raise ValueError(f"Panel heights don't match: {[img.shape for img in images]}")
+    
+    gap_width = _gap_width(images[0].shape[1])
+    gap = np.full((height, gap_width), 255, dtype=np.uint8)
+    
+    pieces = []
+    centers = []
+    gaps = []
+    x = 0
+    for i, img in enumerate(images):
+        if i > 0:
+            pieces.append(gap)
+            gaps.append((x, x + gap_width))
+            x += gap_width
+        pieces.append(_to_uint8(img))
+        centers.append(x + img.shape[1] / 2 - 0.5)
+        x += img.shape[1]
+    return np.concatenate(pieces, axis=1), centers, gaps
+
+
+def _render_meme_rows(
+    rows: list[list[np.ndarray]], dpi: int, background_color: str
+) -> tuple[memoryview, int]:
+    """
+    Draw one meme per row of the reused figure with a single imshow.
+    All rows must have the same panel shapes.
+    
+    Returns
+    -------
+    buffer : memoryview
+        The canvas RGBA buffer (reused by the next draw)
+    row_height : int
+        Height of each meme row in the buffer, in pixels
+    """
+    fig, ax = _get_meme_figure()
+    fig.set_facecolor(background_color)
+    
+    # Concatenate each meme's four panels side by side
+    combined_rows = []
+    for images in rows:
+        combined, centers, gaps = _combine_panels(images)
+        combined_rows.append(combined)
+    height, width = combined_rows[0].shape
+    
+    # Render at the output dpi with the image at an integer pixel scale,
+    # decimating images too wide for the figure
+    step, scale, fig_w, row_height, left, top, bottom = _size_meme_figure(
+        fig, len(rows), height, width, dpi)
+    combined_rows = [combined[::step, ::step] for combined in combined_rows]
+    gap = (top + bottom) // scale
+    
+    # Stack the memes with bands for the titles between them
+    band = np.full((gap, combined_rows[0].shape[1]), 255, dtype=np.uint8)
+    pieces = []
+    for i, combined in enumerate(combined_rows):
+        if i > 0:
+            pieces.append(band)
+        pieces.append(combined)
+    stacked = np.concatenate(pieces) if len(pieces) > 1 else pieces[0]
+    
+    # Mask the gap columns and title bands in one pass, so imshow leaves
+    # them transparent and the figure background shows through
+    mask = np.zeros(stacked.shape, dtype=bool)
+    for start, stop in gaps:
+        mask[:, -(-start // step):-(-stop // step)] = True
+    row_stride = combined_rows[0].shape[0] + gap
+    for i in range(1, len(rows)):
+        mask[i * row_stride - gap:i * row_stride] = True
+    stacked = np.ma.masked_array(stacked, mask=mask)
+    
+    # Display all memes as a single image on the reused axes
+    ax.cla()
+    ax.imshow(stacked, cmap='gray', vmin=0, vmax=255,
+              interpolation='nearest', resample=False)
+    ax.axis('off')
+    
+    # Place the titles in whole display pixels computed from the integer
+    # layout, so a row renders identically wherever it sits in the figure
+    # (float noise in the data transform can flip Agg's text rounding)
+    fig_h = len(rows) * row_height
+    
+    # Add a title 10 points above each panel
+    pad = round(10 * dpi / 72)
+    for i in range(len(rows)):
+        panel_top = fig_h - i * row_height - top
+        for center, title in zip(centers, _PANEL_TITLES):
+            ax.text(left + (center + 0.5) * scale / step, panel_top + pad, title,
+                    transform=IdentityTransform(),
+                    ha='center', va='bottom', fontsize=16, fontweight='bold')
+    
+    # Keep each overall title 0.35 inches below the top edge of its row
+    for i, suptitle in enumerate(_get_meme_titles(fig, len(rows))):
+        suptitle.set_position((fig_w / 2, fig_h - i * row_height - round(0.35 * dpi)))
+    
+    fig.canvas.draw()
+    return fig.canvas.buffer_rgba(), row_height
+
+
+def _gray_vmax(img: np.ndarray) -> float:
+    """
+    White level for a panel: 255 for uint8 images, 1.0 for float images in [0, 1].
+    """
+    return 255 if img.dtype == np.uint8 else 1.0
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """
+    Lazily start the background process used for PNG writes.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=1)
+        atexit.register(_shutdown_executor)
+    return _executor
+
+
+def _shutdown_executor() -> None:
+    """
+    Finish pending background writes and stop the writer process at exit.
+    Write errors are re-raised here rather than silently dropped.
+    """
+    global _executor
+    try:
+        flush_meme_writes()
+    finally:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def _write_png(buffer: np.ndarray, output_path: str, dpi: int) -> None:
+    """
+    Encode an RGBA buffer as PNG and write it to disk.
+    
+    Uses zlib level 1, which encodes several times faster than the default
+    level 6 at the cost of a somewhat larger file, and streams the chunks
+    through a 1 MiB write buffer so the encoder issues few large writes.
+    A partially written file is removed if encoding fails.
+    """
+    try:
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            Image.fromarray(buffer).save(f, 'PNG', dpi=(dpi, dpi), compress_level=1)
+    except Exception:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+
+
+def flush_meme_writes() -> None:
+    """
+    Block until all pending background meme writes have finished.
+    Re-raises the first error encountered by the writer process.
+    """
+    while _pending_writes:
+        _pending_writes.pop(0).result()
+
+
 def create_statistics_meme(
     original_img: np.ndarray,
     stipple_img: np.ndarray, 
@@ -16,7 +329,8 @@ def create_statistics_meme(
     masked_stipple_img: np.ndarray,
     output_path: str = "statistics_meme.png",
     dpi: int = 150,
-    background_color: str = "white"
+    background_color: str = "white",
+    wait: bool = True
 ) -> None:
     """
     Create a four-panel statistics meme demonstrating selection bias.
@@ -24,7 +338,9 @@ def create_statistics_meme(
     Parameters
     ----------
     original_img : np.ndarray
-        Original grayscale image (Reality)
+        Original grayscale image (Reality). All four panels must be 2-D
+        grayscale images of the same height; each may be float in [0, 1]
+        or uint8 in [0, 255].
     stipple_img : np.ndarray
         Stippled image (Your Model) 
     block_letter_img : np.ndarray
@@ -37,38 +353,95 @@ def create_statistics_meme(
         Output resolution in dots per inch
     background_color : str
         Background color for the meme ("white", "lightgray", etc.)
+    wait : bool
+        If True (default), write the PNG in this process before returning.
+        If False, return as soon as the figure is drawn and let a background
+        process write the PNG; call flush_meme_writes() before reading it.
+        On platforms that start processes with spawn (macOS, Windows), the
+        calling script then needs an ``if __name__ == "__main__":`` guard.
     """
-    # Create figure with 1x4 subplots
-    fig = plt.figure(figsize=(16, 4), facecolor=background_color)
+    images = [original_img, stipple_img, block_letter_img, masked_stipple_img]
+    buffer, _ = _render_meme_rows([images], dpi, background_color)
     
-    # Use GridSpec for better control
-    gs = gridspec.GridSpec(1, 4, figure=fig, wspace=0.05, hspace=0)
+    if wait:
+        _write_png(np.asarray(buffer), output_path, dpi)
+        print(f"Statistics meme saved to: {output_path}")
+    else:
+        # Hand a copy of the pixels to the writer process
+        # (the canvas buffer is reused by the next draw)
+        _pending_writes.append(_get_executor().submit(_write_png, np.array(buffer), output_path, dpi))
+        print(f"Statistics meme queued for writing to: {output_path}")
+    print(f"Image size: {_fig.get_size_inches()} inches at {dpi} DPI")
+
+
+def create_statistics_memes_batch(
+    memes: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]],
+    output_paths: list[str],
+    dpi: int = 150,
+    background_color: str = "white",
+    wait: bool = True
+) -> None:
+    """
+    Create many four-panel statistics memes with as few figure draws as possible.
     
-    # Titles for each panel
-    titles = ["Reality", "Your Model", "Selection Bias", "Estimate"]
-    images = [original_img, stipple_img, block_letter_img, masked_stipple_img]
+    The memes are stacked as rows of one figure, drawn together, and each row
+    is cropped from the drawn pixels and written as its own PNG, identical to
+    what create_statistics_meme would produce for it.
     
-    # Create each subplot
-    for i, (title, img) in enumerate(zip(titles, images)):
-        ax = fig.add_subplot(gs[0, i])
-        
-        # Display image
-        ax.imshow(img, cmap='gray', vmin=0, vmax=1)
-        ax.axis('off')
-        
-        # Add title
-        ax.set_title(title, fontsize=16, fontweight='bold', pad=10)
+    Parameters
+    ----------
+    memes : list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]
+        (original, stipple, block letter, masked stipple) images per meme,
+        each a 2-D grayscale panel as in create_statistics_meme.
+        All memes must have the same panel shapes.
+    output_paths : list[str]
+        Path to save each meme, in the same order as memes
+    dpi : int
+        Output resolution in dots per inch
+    background_color : str
+        Background color for the memes ("white", "lightgray", etc.)
+    wait : bool
+        If True (default), write the PNGs in this process before returning.
+        If False, return once all memes are drawn and let a background
+        process write the PNGs; call flush_meme_writes() before reading them.
+        On platforms that start processes with spawn (macOS, Windows), the
+        calling script then needs an ``if __name__ == "__main__":`` guard.
+    """
+    if len(memes) != len(output_paths):
+        raise ValueError(f"Got {len(memes)} memes but {len(output_paths)} output paths")
+    if not memes:
+        return
+    shapes = [img.shape for img in memes[0]]
+    for meme in memes:
+        if [img.shape for img in meme] != shapes:
+            raise ValueError(f"Meme panel shapes don't match: {shapes}, {[img.shape for img in meme]}")
     
-    # Add overall title
-    fig.suptitle("Selection Bias & Missing Data", fontsize=20, fontweight='bold', y=0.95)
+    # Draw as many rows per figure as fit under the height limit
+    height = shapes[0][0]
+    width = sum(shape[1] for shape in shapes) + 3 * _gap_width(shapes[0][1])
+    row_height = _meme_layout(height, width, dpi)[3]
+    rows_per_draw = max(1, _MAX_BATCH_HEIGHT // row_height)
     
-    # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor=background_color)
-    plt.close()
+    for start in range(0, len(memes), rows_per_draw):
+        rows = [list(meme) for meme in memes[start:start + rows_per_draw]]
+        buffer, row_height = _render_meme_rows(rows, dpi, background_color)
+        if wait:
+            buffer = np.asarray(buffer)
+        else:
+            # One copy of the drawn pixels (the canvas buffer is reused by
+            # the next draw); each row's crop is a view into it
+            buffer = np.array(buffer)
+        for i, output_path in enumerate(output_paths[start:start + rows_per_draw]):
+            row = buffer[i * row_height:(i + 1) * row_height]
+            if wait:
+                _write_png(row, output_path, dpi)
+            else:
+                _pending_writes.append(_get_executor().submit(_write_png, row, output_path, dpi))
     
-    print(f"Statistics meme saved to: {output_path}")
-    print(f"Image size: {fig.get_size_inches()} inches at {dpi} DPI")
+    if wait:
+        print(f"Saved {len(memes)} statistics memes")
+    else:
+        print(f"Queued {len(memes)} statistics memes for writing")
 
 
 def create_statistics_meme_vertical(
@@ -83,8 +456,9 @@ def create_statistics_meme_vertical(
     """
     Create a vertical four-panel statistics meme (alternative layout).
     """
-    # Create figure with 4x1 subplots
-    fig = plt.figure(figsize=(6, 16), facecolor=background_color)
+    # Create figure with 4x1 subplots on an Agg canvas, at the output dpi
+    fig = Figure(figsize=(6, 16), dpi=dpi, facecolor=background_color)
+    FigureCanvasAgg(fig)
     
     # Use GridSpec for better control
     gs = gridspec.GridSpec(4, 1, figure=fig, wspace=0, hspace=0.1)
@@ -98,18 +472,22 @@ def create_statistics_meme_vertical(
         ax = fig.add_subplot(gs[i, 0])
         
         # Display image
-        ax.imshow(img, cmap='gray', vmin=0, vmax=1)
+        ax.imshow(img, cmap='gray', vmin=0, vmax=_gray_vmax(img),
+                  interpolation='nearest', resample=False)
         ax.axis('off')
         
         # Add title
         ax.set_title(title, fontsize=14, fontweight='bold', pad=10)
     
     # Add overall title
-    fig.suptitle("Selection Bias & Missing Data", fontsize=18, fontweight='bold', y=0.98)
+    fig.suptitle("Selection Bias & Missing Data", fontsize=18, fontweight='bold', y=0.99)
+    
+    # Fix the layout once instead of tight_layout/bbox_inches='tight',
+    # which would render the figure twice on savefig
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.94, bottom=0.01)
     
-    # Adjust layout and save
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor=background_color)
-    plt.close()
+    # Draw once and encode the canvas pixels directly, bypassing savefig
+    fig.canvas.draw()
+    _write_png(np.asarray(fig.canvas.buffer_rgba()), output_path, dpi)
     
     print(f"Vertical statistics meme saved to: {output_path}")
\ No newline at end of file
@@ -3,16 +3,76 @@ Step 4: Create a block letter for the statistics meme.
 Generates a block letter (default "S") matching image dimensions.
 """
 
+import functools
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
 
 
+# Candidate font paths, tried in order
+_FONT_PATHS = [
+    # Common system fonts
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+    "/System/Library/Fonts/Arial.ttf",      # macOS
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
+    "C:/Windows/Fonts/arialbd.ttf",         # Windows
+    "C:/Windows/Fonts/arial.ttf",           # Windows
+]
+
+# First font path that loaded successfully; found once, then reused
+_font_path: str | None = None
+
+# Rendered letters keyed by (height, width, letter, font_size_ratio),
+# ordered from least to most recently used
+_LETTER_CACHE_SIZE = 32
+_letter_cache: dict[tuple[int, int, str, float], np.ndarray] = {}
+
+
+def _truetype(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, handling .ttc files (TrueType collections).
+    """
+    if font_path.endswith('.ttc'):
+        return ImageFont.truetype(font_path, font_size, index=0)
+    return ImageFont.truetype(font_path, font_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_font(font_size: int) -> ImageFont.FreeTypeFont | None:
+    """
+    Load the first available system font at the given size (cached per size).
+    Returns None if no system font could be loaded.
+    """
+    global _font_path
+    if _font_path is not None:
+        return _truetype(_font_path, font_size)
+    
+    for font_path in _FONT_PATHS:
+        try:
+            if os.path.exists(font_path):
+                font = _truetype(font_path, font_size)
+                _font_path = font_path
+                return font
+        except Exception as e:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _text_bbox(letter: str, font_size: int) -> tuple[int, int, int, int]:
+    """
+    Bounding box of a letter drawn at (0, 0) with the cached system font.
+    """
+    draw = ImageDraw.Draw(Image.new('L', (1, 1)))
+    return draw.textbbox((0, 0), letter, font=_load_font(font_size))
+
+
 def create_block_letter_s(
     height: int, 
     width: int, 
     letter: str = "S", 
-    font_size_ratio: float = 0.9
+    font_size_ratio: float = 0.9,
+    verbose: bool = False
 ) -> np.ndarray:
     """
     Create a block letter matching image dimensions.
@@ -27,58 +87,77 @@ def create_block_letter_s(
         Letter to create (default "S")
     font_size_ratio : float
         Ratio of font size to image height (0.0 to 1.0)
+    verbose : bool
+        If True, print which font was used and the created letter size
     
     Returns
     -------
     letter_img : np.ndarray
-        Binary letter image as 2D array (height, width) 
-        with values in [0, 1] where 0.0 = black letter, 1.0 = white background
+        Binary letter image as 2D uint8 array (height, width) 
+        with values in [0, 255] where 0 = black letter, 255 = white background.
+        The array is cached and shared between calls with the same arguments,
+        so it is read-only; copy it before modifying.
     """
-    # Create a white background image
-    img = Image.new('L', (width, height), color=255)
+    key = (height, width, letter, font_size_ratio)
+    letter_array = _letter_cache.pop(key, None)
+    if letter_array is None:
+        letter_array = _render_block_letter(height, width, letter, font_size_ratio, verbose)
+        letter_array.setflags(write=False)
+        # Evict the least recently used entry once the cache is full
+        if len(_letter_cache) >= _LETTER_CACHE_SIZE:
+            del _letter_cache[next(iter(_letter_cache))]
+    elif verbose:
+        print(f"Reusing cached block letter '{letter}' with size {height}x{width}")
+    # (Re-)insert as the most recently used entry
+    _letter_cache[key] = letter_array
+    return letter_array
+
+
+def _render_block_letter(
+    height: int,
+    width: int,
+    letter: str,
+    font_size_ratio: float,
+    verbose: bool
+) -> np.ndarray:
+    """
+    Render a block letter (see create_block_letter_s) into a new uint8 array.
+    """
+    # Allocate the output array and draw into it through a PIL image that
+    # shares its memory (readonly = 0 stops ImageDraw from copying the buffer)
+    letter_array = np.full((height, width), 255, dtype=np.uint8)
+    img = Image.frombuffer('L', (width, height), letter_array, 'raw', 'L', 0, 1)
+    img.readonly = 0
     draw = ImageDraw.Draw(img)
     
     # Calculate font size based on image height
     font_size = int(height * font_size_ratio)
     
-    # Try multiple font paths
-    font_paths = [
-        # Common system fonts
-        "/System/Library/Fonts/Helvetica.ttc",  # macOS
-        "/System/Library/Fonts/Arial.ttf",      # macOS
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux
-        "C:/Windows/Fonts/arialbd.ttf",         # Windows
-        "C:/Windows/Fonts/arial.ttf",           # Windows
-    ]
-    
-    font = None
-    for font_path in font_paths:
-        try:
-            if os.path.exists(font_path):
-                # Handle .ttc files (TrueType collections)
-                if font_path.endswith('.ttc'):
-                    font = ImageFont.truetype(font_path, font_size, index=0)
-                else:
-                    font = ImageFont.truetype(font_path, font_size)
-                print(f"Using font: {font_path}")
-                break
-        except Exception as e:
-            continue
+    # Load the system font (cached across calls)
+    font = _load_font(font_size)
+    system_font = font is not None
+    if system_font and verbose:
+        print(f"Using font: {_font_path}")
     
     # If no system font found, use default
     if font is None:
         try:
             font = ImageFont.load_default()
-            print("Using default font")
+            if verbose:
+                print("Using default font")
         except:
             # Create a simple block letter using drawing primitives
-            print("Creating block letter using drawing primitives")
+            if verbose:
+                print("Creating block letter using drawing primitives")
             return _create_simple_block_letter(height, width, letter)
     
     # Calculate text position to center it
     try:
         # Try to get text bbox for more accurate centering
-        bbox = draw.textbbox((0, 0), letter, font=font)
+        if system_font:
+            bbox = _text_bbox(letter, font_size)
+        else:
+            bbox = draw.textbbox((0, 0), letter, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
     except:
@@ -92,13 +171,11 @@ def create_block_letter_s(
     # Draw the letter in black
     draw.text((x, y), letter, fill=0, font=font)
     
-    # Convert to numpy array and normalize to [0, 1]
-    letter_array = np.array(img, dtype=np.float32) / 255.0
-    
-    # Invert so letter is black (0.0) on white background (1.0)
+    # Invert so letter is black (0) on white background (255)
     # PIL draws black text on white, so we're already in the right format
     
-    print(f"Created block letter '{letter}' with size {height}x{width}")
+    if verbose:
+        print(f"Created block letter '{letter}' with size {height}x{width}")
     return letter_array
 
 
@@ -134,6 +211,6 @@ def _create_simple_block_letter(height: int, width: int, letter: str = "S") -> n
             center_y + letter_height//2
         ], outline=0, fill=255, width=thickness)
     
-    # Convert to numpy array
-    letter_array = np.array(img, dtype=np.float32) / 255.0
+    # Convert to numpy array (uint8, same format as create_block_letter_s)
+    letter_array = np.asarray(img)
     return letter_array
\ No newline at end of file
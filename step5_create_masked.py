@@ -9,45 +9,71 @@ import numpy as np
 def create_masked_stipple(
     stipple_img: np.ndarray, 
     mask_img: np.ndarray, 
-    threshold: float = 0.5
+    threshold: float = 0.5,
+    verbose: bool = False
 ) -> np.ndarray:
     """
     Apply a block letter mask to the stippled image to demonstrate selection bias.
     
+    Inputs should be contiguous float32 or uint8 arrays; anything else is
+    converted to contiguous float32 first, at the cost of a copy.
+    
     Parameters
     ----------
     stipple_img : np.ndarray
         Stippled image as 2D array (height, width) with values in [0, 1]
-        where 0.0 = black dot, 1.0 = white background
+        where 0.0 = black dot, 1.0 = white background.
+        A uint8 image with values in [0, 255] is also accepted.
     mask_img : np.ndarray  
         Mask image as 2D array (height, width) with values in [0, 1]
-        where 0.0 = black (mask area), 1.0 = white (keep area)
+        where 0.0 = black (mask area), 1.0 = white (keep area).
+        A uint8 image with values in [0, 255] is also accepted.
     threshold : float
-        Threshold for determining mask area (pixels below threshold are masked)
+        Threshold for determining mask area (pixels below threshold are masked),
+        always given on the [0, 1] scale
+    verbose : bool
+        If True, print mask and stipple counts (costs extra passes over the image)
     
     Returns
     -------
     masked_stipple : np.ndarray
         Masked stippled image where stipples in mask area are removed
-        Same format as stipple_img: 0.0 = black dot, 1.0 = white background
+        Same format as stipple_img: 0.0 = black dot, 1.0 = white background.
+        uint8 for a uint8 stipple_img, float32 otherwise
     """
     # Ensure both images have the same shape
     if stipple_img.shape != mask_img.shape:
         raise ValueError(f"Image shapes don't match: stipple {stipple_img.shape}, mask {mask_img.shape}")
     
-    # Create a copy of the stipple image
-    masked_stipple = stipple_img.copy()
+    # Keep the hot path on contiguous float32 (or uint8) data; this is a no-op
+    # for inputs that already have that layout
+    if stipple_img.dtype == np.uint8:
+        stipple_img = np.ascontiguousarray(stipple_img)
+    else:
+        stipple_img = np.ascontiguousarray(stipple_img, dtype=np.float32)
+    if mask_img.dtype == np.uint8:
+        mask_img = np.ascontiguousarray(mask_img)
+    else:
+        mask_img = np.ascontiguousarray(mask_img, dtype=np.float32)
     
     # Identify mask areas (where mask is dark, below threshold)
-    mask_areas = mask_img < threshold
+    if mask_img.dtype == np.uint8:
+        # Same cut-off as mask / 255 < threshold, without converting the mask
+        mask_areas = mask_img < int(np.ceil(threshold * 255))
+    else:
+        mask_areas = mask_img < threshold
     
     # In mask areas, remove stipples by setting to white background (1.0)
     # Note: In stipple_img, 0.0 = black dot (stipple), 1.0 = white background
-    # We want to remove stipples in mask areas, so set those pixels to 1.0 (white)
-    masked_stipple[mask_areas] = 1.0
+    # Since stipples are never brighter than white, a branchless elementwise
+    # maximum with the white-where-masked image does this in one streaming pass
+    white = stipple_img.dtype.type(255 if stipple_img.dtype == np.uint8 else 1.0)
+    masked_stipple = np.maximum(stipple_img, mask_areas * white)
     
-    print(f"Applied mask to stippled image")
-    print(f"Masked areas: {np.sum(mask_areas)} pixels ({np.sum(mask_areas) / mask_areas.size * 100:.1f}% of image)")
-    print(f"Remaining stipples: {np.sum(masked_stipple == 0.0)}")
+    if verbose:
+        mask_count = int(np.count_nonzero(mask_areas))
+        print(f"Applied mask to stippled image")
+        print(f"Masked areas: {mask_count} pixels ({mask_count / mask_areas.size * 100:.1f}% of image)")
+        print(f"Remaining stipples: {np.count_nonzero(masked_stipple == 0)}")
     
-    return masked_stipple
\ No newline at end of file
+    return masked_stipple